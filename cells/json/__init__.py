@@ -18,7 +18,7 @@ from .exceptions import (
     JSONSerializationError,
     UnsupportedTypeError,
 )
-from .serializer import safe_json_dumps, UniversalSerializer
+from .serializer import safe_json_dumps, safe_json_dumps_bytes, safe_json_roundtrip, UniversalSerializer
 from .utils import prettify_json
 from .version import __VERSION__
 
@@ -27,6 +27,8 @@ __all__ = [
     # 核心序列化器
     "UniversalSerializer",
     "safe_json_dumps",
+    "safe_json_dumps_bytes",
+    "safe_json_roundtrip",
     # 异常类
     "JSONSerializationError",
     "JSONEncodeError",
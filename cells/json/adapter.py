@@ -29,6 +29,7 @@ _SERIALIZER_CONFIG_KEYS = {
 _ORJSON_SAFE_DUMPS_KWARGS = {"default"}
 _ORJSON_SAFE_LOADS_KWARGS = set()
 _JSON_BASIC_KEY_TYPES = (str, int, float, bool, type(None))
+_COMPACT_SEPARATORS = (",", ":")
 
 
 def _escape_codepoint_for_json_ascii(character: str) -> str:
@@ -119,7 +120,7 @@ def _validate_orjson_dumps_parameters(
         else:
             _raise_orjson_parameter_error("dumps", "indent")
     if separators is not None:
-        if separators != (",", ":"):
+        if separators != _COMPACT_SEPARATORS:
             _raise_orjson_parameter_error("dumps", "separators")
     if sort_keys:
         option |= getattr(orjson, "OPT_SORT_KEYS", 0)
@@ -263,6 +264,8 @@ class JSONAdapter:
     ) -> str:
         effective_default = self._serializer.default if default is None else default
         json_cls = json.JSONEncoder if cls is None else cls
+        if separators is None and indent is None:
+            separators = _COMPACT_SEPARATORS
         return json.dumps(
             obj,
             skipkeys=skipkeys,
@@ -286,7 +289,14 @@ class JSONAdapter:
         **kwargs: Any,
     ) -> bytes:
         effective_option = self._orjson_option if option is None else (option | self._orjson_option)
-        effective_default = self._serializer.default if default is None else default
+        if default is None:
+            # 预编码片段按默认适配器的选项生成，选项不同时（排序、缩进、调用方传入的 option 等）不能复用
+            if effective_option == _DEFAULT_ADAPTER._orjson_option:
+                effective_default = self._serializer.orjson_default
+            else:
+                effective_default = self._serializer.orjson_unfragmented_default
+        else:
+            effective_default = default
         return orjson.dumps(obj, default=effective_default, option=effective_option, **kwargs)
 
     def dump(
@@ -398,7 +408,9 @@ def _create_adapter(backend: str, use_builtin: bool, config_items: tuple[tuple[s
 _DEFAULT_ADAPTER = JSONAdapter(backend="auto")
 
 
-def _extract_serializer_config(kwargs: dict[str, Any]) -> dict[str, Any]:
+def _extract_serializer_config(kwargs: dict[str, Any]) -> dict[str, Any] | None:
+    if not kwargs:
+        return None
     config: dict[str, Any] = {}
     for key in _SERIALIZER_CONFIG_KEYS:
         if key in kwargs:
@@ -412,9 +424,9 @@ def _get_adapter(
     use_builtin: bool = True,
     config: dict[str, Any] | None = None,
 ) -> JSONAdapter:
-    config = {} if config is None else config
     if backend == "auto" and use_builtin and not config:
         return _DEFAULT_ADAPTER
+    config = {} if config is None else config
     try:
         config_items = tuple(sorted(config.items()))
         return _create_adapter(backend, use_builtin, config_items)
@@ -7,8 +7,11 @@ import json
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from enum import Enum
-from pathlib import Path
-from typing import Any, Callable, Optional, Set
+from functools import lru_cache
+from itertools import repeat
+from math import isfinite
+from pathlib import PurePath
+from typing import Any, Callable, Optional, Set, Union
 from uuid import UUID
 
 from .exceptions import CircularReferenceError, JSONEncodeError, JSONSerializationError
@@ -30,6 +33,152 @@ try:
 except ImportError:
     HAS_PANDAS = False
 
+try:
+    import orjson
+
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+_NONE_TYPE = type(None)
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, _NONE_TYPE})
+_CONTAINER_TYPES = (dict, list, tuple, set, frozenset)
+# 与 orjson 输出保持一致的紧凑分隔符
+_COMPACT_SEPARATORS = (",", ":")
+# 对已转换为基础类型的对象树，可由 orjson 输出与标准库等价结果的 dumps 参数
+# （encode 已把键统一转换为 str，skipkeys 与 check_circular 不影响输出）
+_ORJSON_COMPATIBLE_DUMPS_KWARGS = frozenset({"skipkeys", "ensure_ascii", "check_circular", "sort_keys", "indent", "separators"})
+# orjson OPT_SERIALIZE_NUMPY 原生支持的 dtype 类别（布尔、有/无符号整数、浮点）
+_ORJSON_NUMPY_KINDS = frozenset("biuf")
+
+# 进程级共享的 精确类型 -> 单层转换函数 缓存，只存放与序列化器配置无关的内置类型。
+# 预置常见类型；其余类型（含子类）首次经 isinstance 链解析后写入，所有实例共享。
+_GLOBAL_HANDLERS: dict[type, Callable[[Any], Any]] = {
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    time: time.isoformat,
+    timedelta: timedelta.total_seconds,
+    Decimal: float,
+    UUID: str,
+    set: list,
+    frozenset: list,
+    tuple: list,
+}
+
+
+# 转换结果必为基础类型、不可能引用其他对象的叶子类型；递归编码时无需参与循环检测
+_LEAF_HANDLERS: dict[type, Callable[[Any], Any]] = {
+    t: _GLOBAL_HANDLERS[t] for t in (datetime, date, time, timedelta, Decimal, UUID)
+}
+
+# 仅 orjson 回调使用的 类型 -> 专用转换函数，与 orjson 输出选项无关。
+# numpy 处理在导入时按是否安装决定是否注册，回调热路径上不再判断 HAS_NUMPY。
+_ORJSON_HANDLERS: dict[type, Callable[[Any], Any]] = {}
+# orjson_default 按类型缓存的转换函数：优先 __json_fragment__，其次 _ORJSON_HANDLERS（无则为 None，回退到 default）
+_ORJSON_FRAGMENT_HANDLERS: dict[type, Optional[Callable[[Any], Any]]] = {}
+_MISSING = object()
+
+if HAS_NUMPY:
+
+    def _orjson_ndarray(obj: Any) -> Any:
+        # orjson 只接受本机字节序的数组，非本机字节序仍走 tolist()
+        if obj.dtype.kind in _ORJSON_NUMPY_KINDS and obj.dtype.isnative and not obj.flags.c_contiguous:
+            return np.ascontiguousarray(obj)
+        return obj.tolist()
+
+    _ORJSON_HANDLERS[np.ndarray] = _orjson_ndarray
+
+
+# 基础类型子类 -> 还原为精确基础类型的函数（绕过子类可能重写的 __str__/__int__ 等）。
+# orjson 不接受 float 等子类，原样保留会落入 default 回调被当作普通对象处理。
+_PRIMITIVE_CASTS: dict[type, Callable[[Any], Any]] = {
+    str: str.__str__,
+    int: int.__int__,
+    float: float.__float__,
+}
+
+
+def _prepare_stdlib_kwargs(kwargs: dict[str, Any], pre_encoded: bool) -> dict[str, Any]:
+    """补全标准库 json 的默认参数。
+
+    未缩进时默认使用紧凑分隔符；经 encode 预转换的对象树已不含循环引用，可跳过标准库的循环检测。
+    """
+    if kwargs.get("indent") is None:
+        kwargs.setdefault("separators", _COMPACT_SEPARATORS)
+    if pre_encoded:
+        kwargs.setdefault("check_circular", False)
+    return kwargs
+
+
+def _slot_names(obj_type: type) -> tuple[str, ...]:
+    """收集类及其基类声明的全部 __slots__ 名称。"""
+    names: list[str] = []
+    for base in reversed(obj_type.__mro__):
+        slots = base.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name not in ("__dict__", "__weakref__") and name not in names:
+                names.append(name)
+    return tuple(names)
+
+
+def _make_slots_handler(obj_type: type) -> Callable[[Any], Any]:
+    """按类型预先计算槽位名称，避免每次序列化都读取 __slots__ 并 hasattr 探测。"""
+    names = _slot_names(obj_type)
+    missing = object()
+
+    def handler(obj: Any) -> dict:
+        result = {}
+        for name in names:
+            value = getattr(obj, name, missing)
+            if value is not missing:
+                result[name] = value
+        return result
+
+    return handler
+
+
+def _serialize_series(obj: Any) -> Any:
+    if obj.name is not None:
+        return {str(obj.name): obj.tolist()}
+    return obj.to_dict()
+
+
+def _resolve_builtin_handler(obj: Any) -> Optional[Callable[[Any], Any]]:
+    """按 isinstance 链查找内置类型的转换函数。"""
+    # 1. 基础类型
+    if isinstance(obj, (datetime, date, time)):
+        return lambda o: o.isoformat()
+    if isinstance(obj, timedelta):
+        return lambda o: o.total_seconds()
+    if isinstance(obj, Decimal):
+        return lambda o: float(o)
+    if isinstance(obj, UUID):
+        return lambda o: str(o)
+    if isinstance(obj, Enum):
+        return lambda o: o.value
+    if isinstance(obj, PurePath):
+        return lambda o: o.as_posix()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return lambda o: list(o)
+
+    # 2. 科学计算
+    if HAS_NUMPY:
+        if isinstance(obj, np.ndarray):
+            return lambda o: o.tolist()
+        if isinstance(obj, np.generic):
+            return lambda o: o.item()
+    if HAS_PANDAS:
+        if isinstance(obj, pd.DataFrame):
+            return lambda o: o.to_dict("records")
+        if isinstance(obj, pd.Series):
+            return _serialize_series
+
+    return None
+
 
 class UniversalSerializer:
     """通用 JSON 序列化转换器。
@@ -39,11 +188,11 @@ class UniversalSerializer:
     - **数值**: `Decimal` (转换为 float)。
     - **标识符**: `UUID` (转换为字符串)。
     - **枚举**: `Enum` (转换为其 value)。
-    - **路径**: `Path` (转换为 POSIX 风格字符串)。
+    - **路径**: `Path`/`PurePath` (转换为 POSIX 风格字符串)。
     - **科学计算**:
         - `numpy`: `ndarray` (转换为 list), `generic` 类型 (转换为对应原生类型)。
         - `pandas`: `DataFrame` (转换为记录列表), `Series` (转换为 dict/list)。
-    - **容器**: `set`, `tuple` (转换为 list)。
+    - **容器**: `set`, `frozenset`, `tuple` (转换为 list)。
     - **自定义对象**:
         - 优先调用 `to_dict()` 方法。
         - 其次尝试使用 `__dict__` 或 `__slots__` 属性。
@@ -58,6 +207,16 @@ class UniversalSerializer:
         ```
     """
 
+    __slots__ = (
+        "_custom_default",
+        "_strict",
+        "_ignore_unknown",
+        "_fail_on_circular",
+        "_use_dict",
+        "_type_cache",
+        "_recursive_dispatch",
+    )
+
     def __init__(
         self,
         default: Optional[Callable[[Any], Any]] = None,
@@ -80,8 +239,14 @@ class UniversalSerializer:
         self._ignore_unknown = ignore_unknown
         self._fail_on_circular = fail_on_circular
         self._use_dict = use_dict if use_dict is not None else not ignore_unknown
-        self._seen: Set[int] = set()
         self._type_cache: dict[type, Callable[[Any], Any]] = {}
+        self._recursive_dispatch: dict[type, Callable[[Any, Set[int]], Any]] = {
+            dict: self._serialize_dict,
+            list: self._serialize_iterable,
+            tuple: self._serialize_iterable,
+            set: self._serialize_iterable,
+            frozenset: self._serialize_iterable,
+        }
 
     def _handle_unknown(self, obj: Any) -> Any:
         """处理未知类型的统一逻辑。
@@ -114,67 +279,88 @@ class UniversalSerializer:
             JSONEncodeError: 转换失败时抛出。
         """
         obj_type = type(obj)
-        if handler := self._type_cache.get(obj_type):
+        if handler := _GLOBAL_HANDLERS.get(obj_type) or self._type_cache.get(obj_type):
             return handler(obj)
 
         handler = self._get_handler(obj)
         if handler:
-            self._type_cache[obj_type] = handler
             return handler(obj)
 
         return self._handle_unknown(obj)
 
+    def orjson_default(self, obj: Any) -> Any:
+        """提供给 orjson 的单层回调。
+
+        开启 `OPT_SERIALIZE_NUMPY` 后，orjson 只会把非 C 连续或 dtype 不受支持的 ndarray 交给回调。
+        前者转换为连续内存后交还 orjson 原生编码，避免 `tolist()` 逐元素创建 Python 对象。
+        实现了 `__json_fragment__` 的对象（见 `utils.json_fragment`）直接返回预编码的 `orjson.Fragment`。
+
+        Args:
+            obj: 待转换的对象。
+
+        Returns:
+            Any: 转换后的对象。
+        """
+        obj_type = type(obj)
+        handler = _ORJSON_FRAGMENT_HANDLERS.get(obj_type, _MISSING)
+        if handler is _MISSING:
+            handler = _ORJSON_FRAGMENT_HANDLERS.setdefault(
+                obj_type, getattr(obj_type, "__json_fragment__", None) or _ORJSON_HANDLERS.get(obj_type)
+            )
+        if handler is not None:
+            return handler(obj)
+        return self.default(obj)
+
+    def orjson_unfragmented_default(self, obj: Any) -> Any:
+        """提供给 orjson 的单层回调，不使用预编码片段。
+
+        片段按默认适配器的选项编码，无法应用排序、缩进等其他选项；orjson 选项与默认不同时改用此回调。
+
+        Args:
+            obj: 待转换的对象。
+
+        Returns:
+            Any: 转换后的对象。
+        """
+        handler = _ORJSON_HANDLERS.get(type(obj))
+        if handler is not None:
+            return handler(obj)
+        return self.default(obj)
+
     def _get_handler(self, obj: Any) -> Optional[Callable[[Any], Any]]:
-        """查找并返回对象的转换函数。"""
-        # 1. 基础类型
-        if isinstance(obj, (datetime, date, time)):
-            return lambda o: o.isoformat()
-        if isinstance(obj, timedelta):
-            return lambda o: o.total_seconds()
-        if isinstance(obj, Decimal):
-            return lambda o: float(o)
-        if isinstance(obj, UUID):
-            return lambda o: str(o)
-        if isinstance(obj, Enum):
-            return lambda o: o.value
-        if isinstance(obj, Path):
-            return lambda o: o.as_posix()
-        if isinstance(obj, (set, tuple)):
-            return lambda o: list(o)
-
-        # 2. 科学计算
-        if HAS_NUMPY:
-            if isinstance(obj, np.ndarray):
-                return lambda o: o.tolist()
-            if isinstance(obj, np.generic):
-                return lambda o: o.item()
-        if HAS_PANDAS:
-            if isinstance(obj, pd.DataFrame):
-                return lambda o: o.to_dict("records")
-            if isinstance(obj, pd.Series):
-                if obj.name is not None:
-                    return lambda o: {str(o.name): o.tolist()}
-                return lambda o: o.to_dict()
-
-        # 3. 自定义对象
+        """查找并缓存对象的转换函数。
+
+        内置类型的转换与实例配置无关，写入进程级共享缓存；
+        自定义对象的策略受 strict/use_dict 影响，只缓存在当前实例。
+        """
+        obj_type = type(obj)
+        handler = _resolve_builtin_handler(obj)
+        if handler is not None:
+            return _GLOBAL_HANDLERS.setdefault(obj_type, handler)
+
+        # 自定义对象
         if not self._strict:
-            if hasattr(obj, "to_dict") and callable(obj.to_dict):
-                return lambda o: o.to_dict()
-            if self._use_dict:
+            # 在类型上探测 to_dict，与按类型缓存的策略保持一致，也避免触发实例属性查找
+            if callable(getattr(obj_type, "to_dict", None)):
+                handler = lambda o: o.to_dict()
+            elif self._use_dict:
                 if hasattr(obj, "__dict__"):
-                    return lambda o: o.__dict__
-                if hasattr(obj, "__slots__"):
-                    return lambda o: {s: getattr(o, s) for s in o.__slots__ if hasattr(o, s)}
+                    handler = lambda o: o.__dict__
+                elif hasattr(obj, "__slots__"):
+                    handler = _make_slots_handler(obj_type)
 
-        return None
+        if handler is not None:
+            self._type_cache[obj_type] = handler
+        return handler
 
-    def _serialize_recursive(self, obj: Any) -> Any:
+    def _serialize_recursive(self, obj: Any, seen: Optional[Set[int]] = None) -> Any:
         """递归序列化 (Safe Path)。
 
         用于支持循环引用检测和标记字符串生成。
 
         Args:
             obj: 待转换的对象。
+            seen: 当前递归路径上的对象 id 集合，首次遇到非基础类型时才分配。
 
         Returns:
             Any: 递归转换后的基础 Python 类型。
@@ -182,48 +368,103 @@ class UniversalSerializer:
         Raises:
             CircularReferenceError: 检测到循环引用且开启了 fail_on_circular 时抛出。
         """
-        if obj is None or isinstance(obj, (str, int, float, bool)):
+        obj_type = type(obj)
+        # str 是最常见的叶子类型，先做一次身份比较，其余基础类型走集合查找
+        if obj_type is str or obj_type in _PRIMITIVE_TYPES:
             return obj
 
+        handler = self._recursive_dispatch.get(obj_type)
+        if handler is None:
+            leaf = _LEAF_HANDLERS.get(obj_type)
+            if leaf is not None:
+                return leaf(obj)
+            handler = self._resolve_recursive_handler(obj_type)
+
         obj_id = id(obj)
-        if obj_id in self._seen:
+        if seen is None:
+            seen = set()
+        elif obj_id in seen:
             if self._fail_on_circular:
                 raise CircularReferenceError(obj)
-            return f"<CircularReference {type(obj).__name__}>"
+            return f"<CircularReference {obj_type.__name__}>"
 
-        self._seen.add(obj_id)
+        seen.add(obj_id)
         try:
-            if isinstance(obj, dict):
-                return {str(k): self._serialize_recursive(v) for k, v in obj.items()}
-            if isinstance(obj, (list, tuple, set)):
-                return [self._serialize_recursive(item) for item in obj]
-
-            # 对于其他类型，先尝试单层转换
-            try:
-                res = self.default(obj)
-                # 如果返回的是 None 且开启了 ignore_unknown，直接返回 None
-                if res is None and self._ignore_unknown:
-                    return None
-                # 如果返回了新对象，继续递归
-                if res is not obj:
-                    return self._serialize_recursive(res)
-            except JSONEncodeError:
-                pass
-
-            return self._handle_unknown(obj)
+            return handler(obj, seen)
         finally:
-            self._seen.discard(obj_id)
+            seen.discard(obj_id)
+
+    def _resolve_recursive_handler(self, obj_type: type) -> Callable[[Any, Set[int]], Any]:
+        """沿 MRO 查找递归处理函数，并缓存到分发表中。"""
+        handler = self._serialize_object
+        for base in obj_type.__mro__:
+            if base in _PRIMITIVE_TYPES:
+                cast = _PRIMITIVE_CASTS[base]
+                handler = lambda o, seen: cast(o)
+                break
+            if base in _CONTAINER_TYPES:
+                handler = self._recursive_dispatch[base]
+                break
+        self._recursive_dispatch[obj_type] = handler
+        return handler
+
+    def _serialize_dict(self, obj: dict, seen: Set[int]) -> dict:
+        if not all(type(k) is str for k in obj):
+            return dict(zip(map(str, obj), map(self._serialize_recursive, obj.values(), repeat(seen))))
+
+        # 单次扫描：全部为基础类型时原样返回（含 to_dict()/__dict__ 的结果，不复制）；
+        # 否则只复制一次，并仅替换少数非基础类型的值
+        result = None
+        for k, v in obj.items():
+            if type(v) not in _PRIMITIVE_TYPES:
+                if result is None:
+                    result = dict(obj)
+                result[k] = self._serialize_recursive(v, seen)
+        return obj if result is None else result
+
+    def _serialize_iterable(self, obj: Any, seen: Set[int]) -> list:
+        if all(type(item) in _PRIMITIVE_TYPES for item in obj):
+            return obj if type(obj) is list else list(obj)
+        return list(map(self._serialize_recursive, obj, repeat(seen)))
+
+    def _serialize_object(self, obj: Any, seen: Set[int]) -> Any:
+        """对非容器类型先尝试单层转换，再递归处理转换结果。"""
+        try:
+            res = self.default(obj)
+            # 如果返回的是 None 且开启了 ignore_unknown，直接返回 None
+            if res is None and self._ignore_unknown:
+                return None
+            # 如果返回了新对象，继续递归
+            if res is not obj:
+                # to_dict()/__dict__ 返回的 dict 直接展开，省去二次分发；但它可能是对象持有、
+                # 可被自身引用的字典（如 return self.d），仍需登记到 seen。已在 seen 中时交给
+                # _serialize_recursive 生成循环引用标记
+                if type(res) is dict:
+                    res_id = id(res)
+                    if res_id not in seen:
+                        seen.add(res_id)
+                        try:
+                            return self._serialize_dict(res, seen)
+                        finally:
+                            seen.discard(res_id)
+                return self._serialize_recursive(res, seen)
+        except JSONEncodeError:
+            pass
+
+        return self._handle_unknown(obj)
 
     def encode(self, obj: Any) -> Any:
         """完整地将对象树转换为基础 Python 类型。
 
+        为避免复制，值全为基础类型的 dict/list（包括调用方传入的容器、对象的 `__dict__` 与 `to_dict()` 结果）
+        会被原样放入结果，与原对象共享。请勿原地修改返回值，需要独立副本时请使用 `copy.deepcopy` 或 `safe_json_roundtrip`。
+
         Args:
             obj: 原始对象树。
 
         Returns:
-            Any: 转换后的对象树。
+            Any: 转换后的对象树，可能与原对象共享 dict/list。
         """
-        self._seen.clear()
         return self._serialize_recursive(obj)
 
     def dumps(self, obj: Any, recursive: bool = False, **kwargs: Any) -> str:
@@ -243,9 +484,9 @@ class UniversalSerializer:
         """
         try:
             if recursive or self._fail_on_circular or not kwargs.get("check_circular", True):
-                return json.dumps(self.encode(obj), **kwargs)
+                return json.dumps(self.encode(obj), **_prepare_stdlib_kwargs(kwargs, pre_encoded=True))
             else:
-                return json.dumps(obj, default=self.default, **kwargs)
+                return json.dumps(obj, default=self.default, **_prepare_stdlib_kwargs(kwargs, pre_encoded=False))
         except (TypeError, ValueError) as e:
             if "Circular reference" in str(e):
                 if self._fail_on_circular:
@@ -265,13 +506,97 @@ class UniversalSerializer:
         """
         try:
             if self._fail_on_circular or not kwargs.get("check_circular", True):
-                json.dump(self.encode(obj), fp, **kwargs)
+                json.dump(self.encode(obj), fp, **_prepare_stdlib_kwargs(kwargs, pre_encoded=True))
             else:
-                json.dump(obj, fp, default=self.default, **kwargs)
+                json.dump(obj, fp, default=self.default, **_prepare_stdlib_kwargs(kwargs, pre_encoded=False))
         except (TypeError, ValueError) as e:
             raise JSONEncodeError(obj, str(e)) from e
 
 
+def _has_non_finite(encoded: Any) -> bool:
+    """检查预转换后的对象树中是否含有 NaN/Infinity。"""
+    obj_type = type(encoded)
+    if obj_type is float:
+        return not isfinite(encoded)
+    # 全为基础类型的 dict 子类（OrderedDict、defaultdict 等）会被原样保留，需按 isinstance 判断
+    if isinstance(encoded, dict):
+        return any(map(_has_non_finite, encoded.values()))
+    if obj_type is list:
+        return any(map(_has_non_finite, encoded))
+    return False
+
+
+def _orjson_dumps_option(kwargs: dict[str, Any]) -> Optional[int]:
+    """把标准库风格的 dumps 参数换算为 orjson 选项；无法由 orjson 输出等价结果时返回 None。"""
+    if not HAS_ORJSON or any(key not in _ORJSON_COMPATIBLE_DUMPS_KWARGS for key in kwargs):
+        return None
+    option = orjson.OPT_SORT_KEYS if kwargs.get("sort_keys") else 0
+    indent = kwargs.get("indent")
+    separators = kwargs.get("separators")
+    if indent is None:
+        return option if separators is None or separators == _COMPACT_SEPARATORS else None
+    if indent == 2 and separators is None:
+        return option | orjson.OPT_INDENT_2
+    return None
+
+
+def _orjson_dumps_encoded(encoded: Any, kwargs: dict[str, Any], as_bytes: bool = False) -> Optional[Union[str, bytes]]:
+    """尝试用 orjson 编码经 encode 预转换的对象树。
+
+    参数无法等价表达、orjson 无法编码（如超出 64 位的整数）、含有 orjson 会输出为 null 的 NaN/Infinity，
+    或要求 ensure_ascii 而输出含非 ASCII 字符（交给标准库的 C 实现转义更快）时返回 None。
+    """
+    option = _orjson_dumps_option(kwargs)
+    if option is None:
+        return None
+    try:
+        result = orjson.dumps(encoded, option=option)
+    except orjson.JSONEncodeError:
+        return None
+    if kwargs.get("ensure_ascii", True) and not result.isascii():
+        return None
+    # 非有限浮点数只可能表现为 null，输出不含 null 时无需遍历对象树
+    if b"null" in result and _has_non_finite(encoded):
+        return None
+    return result if as_bytes else result.decode("utf-8")
+
+
+def _stdlib_dumps_encoded(obj: Any, encoded: Any, kwargs: dict[str, Any]) -> str:
+    """用标准库编码经 encode 预转换的对象树。"""
+    try:
+        return json.dumps(encoded, **_prepare_stdlib_kwargs(kwargs, pre_encoded=True))
+    except (TypeError, ValueError) as e:
+        raise JSONEncodeError(obj, str(e)) from e
+
+
+def _dumps_encoded(obj: Any, encoded: Any, kwargs: dict[str, Any], as_bytes: bool = False) -> Union[str, bytes]:
+    """编码经 encode 预转换的对象树。
+
+    参数可由 orjson 等价表达时走 orjson 主路径；否则，或 orjson 无法编码（如超出 64 位的整数）时，回退到标准库。
+    """
+    result = _orjson_dumps_encoded(encoded, kwargs, as_bytes)
+    if result is not None:
+        return result
+    result = _stdlib_dumps_encoded(obj, encoded, kwargs)
+    return result.encode("utf-8") if as_bytes else result
+
+
+@lru_cache(maxsize=32)
+def _get_serializer(
+    strict: bool = False,
+    ignore_unknown: bool = False,
+    fail_on_circular: bool = False,
+    use_dict: Optional[bool] = None,
+) -> UniversalSerializer:
+    """按配置复用序列化器实例，避免热点路径上重复构建分发表。"""
+    return UniversalSerializer(
+        strict=strict,
+        ignore_unknown=ignore_unknown,
+        fail_on_circular=fail_on_circular,
+        use_dict=use_dict,
+    )
+
+
 def universal_serializer(obj: Any) -> Any:
     """快捷回调函数。
 
@@ -281,7 +606,7 @@ def universal_serializer(obj: Any) -> Any:
     Returns:
         Any: 转换结果。
     """
-    return UniversalSerializer().default(obj)
+    return _get_serializer().default(obj)
 
 
 def safe_json_dumps(
@@ -322,14 +647,108 @@ def safe_json_dumps(
         ```
     """
     try:
-        serializer = UniversalSerializer(
+        serializer = _get_serializer(
             strict=strict,
             ignore_unknown=ignore_unknown,
             fail_on_circular=fail_on_circular,
-            use_dict=use_dict
+            use_dict=use_dict,
         )
-        return serializer.dumps(data, recursive=True, **kwargs)
+        return _dumps_encoded(data, serializer.encode(data), kwargs)
     except (JSONSerializationError, JSONEncodeError, CircularReferenceError):
         if ignore_errors:
             return default_value
         raise
+
+
+def safe_json_dumps_bytes(
+    data: Any,
+    *,
+    ignore_errors: bool = False,
+    default_value: bytes = b"null",
+    strict: bool = False,
+    ignore_unknown: bool = False,
+    fail_on_circular: bool = False,
+    use_dict: Optional[bool] = None,
+    **kwargs: Any,
+) -> bytes:
+    """安全的 JSON 序列化函数，直接返回 UTF-8 字节。
+
+    行为与 `safe_json_dumps` 一致，但 orjson 主路径下省去 bytes -> str 的解码，
+    适合写文件、网络响应等最终需要字节的场景。
+
+    Args:
+        data: 待序列化的数据。
+        ignore_errors: 发生错误时是否忽略并返回 default_value。
+        default_value: 忽略错误时返回的默认字节串。
+        strict: 严格模式，遇到未知类型抛出异常。
+        ignore_unknown: 忽略未知类型，序列化为 None。
+        fail_on_circular: 发现循环引用时抛出异常 (False 则返回 marker 字符串)。
+        use_dict: 是否自动使用 __dict__ 序列化自定义对象。
+        **kwargs: 传递给 json.dumps 的参数 (如 indent, ensure_ascii 等)。
+
+    Returns:
+        bytes: UTF-8 编码的 JSON。
+
+    Raises:
+        JSONEncodeError: 序列化失败且未开启 ignore_errors 时抛出。
+        CircularReferenceError: 发现循环引用且开启了 fail_on_circular时抛出。
+    """
+    try:
+        serializer = _get_serializer(
+            strict=strict,
+            ignore_unknown=ignore_unknown,
+            fail_on_circular=fail_on_circular,
+            use_dict=use_dict,
+        )
+        return _dumps_encoded(data, serializer.encode(data), kwargs, as_bytes=True)
+    except (JSONSerializationError, JSONEncodeError, CircularReferenceError):
+        if ignore_errors:
+            return default_value
+        raise
+
+
+def safe_json_roundtrip(
+    data: Any,
+    *,
+    strict: bool = False,
+    ignore_unknown: bool = False,
+    fail_on_circular: bool = False,
+    use_dict: Optional[bool] = None,
+) -> Any:
+    """按 `safe_json_dumps` 的规则序列化后再解析，得到纯 JSON 类型的对象树。
+
+    orjson 主路径下全程使用字节（不经过 str），适合断言、深拷贝为 JSON 兼容结构等场景。
+
+    Args:
+        data: 待转换的数据。
+        strict: 严格模式，遇到未知类型抛出异常。
+        ignore_unknown: 忽略未知类型，序列化为 None。
+        fail_on_circular: 发现循环引用时抛出异常 (False 则返回 marker 字符串)。
+        use_dict: 是否自动使用 __dict__ 序列化自定义对象。
+
+    Returns:
+        Any: 解析后的 dict/list/str/int/float/bool/None 对象树。
+
+    Raises:
+        JSONEncodeError: 序列化失败时抛出。
+        CircularReferenceError: 发现循环引用且开启了 fail_on_circular时抛出。
+
+    Examples:
+        ```python
+        from decimal import Decimal
+        safe_json_roundtrip({"amount": Decimal("10.50")})  # {"amount": 10.5}
+        ```
+    """
+    serializer = _get_serializer(
+        strict=strict,
+        ignore_unknown=ignore_unknown,
+        fail_on_circular=fail_on_circular,
+        use_dict=use_dict,
+    )
+    encoded = serializer.encode(data)
+    kwargs = {"ensure_ascii": False}
+    payload = _orjson_dumps_encoded(encoded, kwargs, as_bytes=True)
+    if payload is not None:
+        return orjson.loads(payload)
+    # 回退标准库编码时（如超出 64 位的整数、NaN）同样用标准库解析，结果与 json.loads(safe_json_dumps(...)) 一致
+    return json.loads(_stdlib_dumps_encoded(data, encoded, kwargs))
@@ -3,15 +3,22 @@
 提供便捷的装饰器和辅助函数。
 """
 
+import json
+import re
+import weakref
 from functools import wraps
 from pathlib import Path
 from typing import Any, TypeVar
 
-from .serializer import safe_json_dumps, UniversalSerializer
+from .adapter import _DEFAULT_ADAPTER, orjson
+from .serializer import _get_serializer, _slot_names, safe_json_dumps, safe_json_dumps_bytes
 
 
 T = TypeVar("T")
 
+# orjson 会把超出 64 位的整数解析为 float；含 20 位以上连续数字（负数为 19 位）时可能越界，交给标准库解析
+_LONG_DIGITS = re.compile(rb"-\d{19}|\d{20}")
+
 
 class JsonSerializable:
     """可序列化的基类
@@ -26,7 +33,7 @@ class JsonSerializable:
         ...
         >>> user = User("Alice", 25)
         >>> user.to_json()
-        '{"name": "Alice", "age": 25}'
+        '{"name":"Alice","age":25}'
     """
 
     def to_dict(self) -> dict:
@@ -45,7 +52,7 @@ class JsonSerializable:
         :param kwargs: json.dumps 的额外参数
         :return: JSON 字符串
         """
-        serializer = UniversalSerializer()
+        serializer = _get_serializer()
         return serializer.dumps(self.to_dict(), **kwargs)
 
     @classmethod
@@ -58,6 +65,55 @@ class JsonSerializable:
         return cls(**data)
 
 
+def _instances_have_dict(cls: type) -> bool:
+    """判断类的实例是否带有 __dict__（继承链中任一类未声明 __slots__ 或显式声明了 __dict__ 槽位）。"""
+    for base in cls.__mro__:
+        if base is object:
+            continue
+        slots = vars(base).get("__slots__")
+        if slots is None:
+            return True
+        if "__dict__" in ((slots,) if isinstance(slots, str) else slots):
+            return True
+    return False
+
+
+def _instance_to_dict(obj: Any) -> dict:
+    """按实例的实际类型收集全部槽位与 __dict__ 属性，未赋值的槽位跳过。"""
+    result = {}
+    for name in _slot_names(type(obj)):
+        try:
+            result[name] = getattr(obj, name)
+        except AttributeError:
+            pass
+    result.update(getattr(obj, "__dict__", {}))
+    return result
+
+
+def _compile_slots_to_dict(cls: type, slot_names: tuple[str, ...]) -> Any:
+    """为固定的槽位生成专用的 to_dict，逐个直接读取属性，未赋值的槽位跳过。
+
+    子类可能新增槽位或 __dict__，其实例改用 _instance_to_dict 按实际类型收集。
+    """
+    lines = [
+        "def to_dict(self):",
+        "    if type(self) is not cls:",
+        "        return _instance_to_dict(self)",
+        "    result = {}",
+    ]
+    for name in slot_names:
+        lines.extend([
+            "    try:",
+            f"        result[{name!r}] = self.{name}",
+            "    except AttributeError:",
+            "        pass",
+        ])
+    lines.append("    return result")
+    namespace: dict[str, Any] = {"cls": cls, "_instance_to_dict": _instance_to_dict}
+    exec("\n".join(lines), namespace)
+    return namespace["to_dict"]
+
+
 def json_serializable(cls: type[T]) -> type[T]:
     """类装饰器，使类具有 JSON 序列化能力
 
@@ -70,7 +126,7 @@ def json_serializable(cls: type[T]) -> type[T]:
         ...
         >>> point = Point(10, 20)
         >>> point.to_json()
-        '{"x": 10, "y": 20}'
+        '{"x":10,"y":20}'
     """
 
     original_init = cls.__init__
@@ -79,20 +135,18 @@ def json_serializable(cls: type[T]) -> type[T]:
     def __init__(self, *args, **kwargs):
         original_init(self, *args, **kwargs)
 
-    def to_dict(self) -> dict:
-        """将对象转换为字典"""
-        result = {}
-        if hasattr(self, "__dict__"):
-            result.update(self.__dict__)
-        elif hasattr(self, "__slots__"):
-            for slot in self.__slots__:
-                if hasattr(self, slot):
-                    result[slot] = getattr(self, slot)
-        return result
+    if _instances_have_dict(cls):
+        def to_dict(self) -> dict:
+            """将对象转换为字典"""
+            return dict(self.__dict__)
+    else:
+        # 纯 __slots__ 类的字段在装饰时即可确定，生成专用函数，避免每次反射 __slots__
+        to_dict = _compile_slots_to_dict(cls, _slot_names(cls))
+        to_dict.__doc__ = "将对象转换为字典"
 
     def to_json(self, **kwargs: Any) -> str:
         """将对象序列化为 JSON 字符串"""
-        serializer = UniversalSerializer()
+        serializer = _get_serializer()
         return serializer.dumps(self.to_dict(), **kwargs)
 
     @classmethod
@@ -108,12 +162,53 @@ def json_serializable(cls: type[T]) -> type[T]:
     return cls
 
 
+def _encode_fragment(obj: Any) -> Any:
+    return orjson.Fragment(_DEFAULT_ADAPTER.dumps(obj.to_dict(), ensure_ascii=False, ensure_str=False))
+
+
+def json_fragment(cls: type[T]) -> type[T]:
+    """类装饰器，缓存实例的 JSON 编码结果，供 orjson 原样拼接
+
+    首次编码时缓存 `to_dict()` 的 orjson 输出，之后在 orjson 主路径下以 `orjson.Fragment`
+    直接写入结果，不再重复编码。仅适用于 `to_dict()` 结果不会变化的对象（如配置、schema）。
+    orjson 不支持 Fragment 时原样返回类，序列化行为不变。
+
+    Example:
+        >>> @json_fragment
+        ... class Schema(JsonSerializable):
+        ...     def __init__(self, fields):
+        ...         self.fields = fields
+        ...
+        >>> dumps({"schema": Schema(["id", "name"])})
+        '{"schema":{"fields":["id","name"]}}'
+    """
+    if not callable(getattr(cls, "to_dict", None)):
+        raise TypeError(f"{cls.__name__} must define to_dict() to use @json_fragment")
+    if not hasattr(orjson, "Fragment"):
+        return cls
+
+    cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def __json_fragment__(self):
+        try:
+            fragment = cache.get(self)
+        except TypeError:
+            # 不可哈希或不支持弱引用的实例无法缓存
+            return _encode_fragment(self)
+        if fragment is None:
+            fragment = cache[self] = _encode_fragment(self)
+        return fragment
+
+    cls.__json_fragment__ = __json_fragment__
+    return cls
+
+
 def save_json(data: Any, filepath: str | Path, **kwargs: Any) -> None:
     """将数据保存为 JSON 文件
 
     :param data: 待保存的数据
     :param filepath: 文件路径
-    :param kwargs: json.dump 的额外参数
+    :param kwargs: safe_json_dumps_bytes 的额外参数
     :raises JSONSerializationError: 如果序列化失败
 
     Example:
@@ -123,16 +218,17 @@ def save_json(data: Any, filepath: str | Path, **kwargs: Any) -> None:
     filepath = Path(filepath)
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
-    serializer = UniversalSerializer()
-    with open(filepath, "w", encoding="utf-8") as f:
-        serializer.dump(data, f, **kwargs)
+    # 一次性编码为 UTF-8 字节并单次写入，避免 json.dump 逐片段写入文本流
+    payload = safe_json_dumps_bytes(data, **kwargs)
+    with open(filepath, "wb") as f:
+        f.write(payload)
 
 
 def load_json(filepath: str | Path, **kwargs: Any) -> Any:
     """从 JSON 文件加载数据
 
     :param filepath: 文件路径
-    :param kwargs: json.load 的额外参数
+    :param kwargs: json.load 的额外参数，传入时使用标准库解析
     :return: 加载的数据
 
     Example:
@@ -140,11 +236,16 @@ def load_json(filepath: str | Path, **kwargs: Any) -> Any:
         >>> print(data)
         {'name': 'Alice', 'age': 25}
     """
-    import json
-
     filepath = Path(filepath)
-    with open(filepath, "r", encoding="utf-8") as f:
-        return json.load(f, **kwargs)
+    payload = filepath.read_bytes()
+    # 直接调用标准库与 orjson（其 JSONDecodeError 继承自 json.JSONDecodeError），解析失败时保持抛出 json.JSONDecodeError
+    if kwargs or orjson is None or _LONG_DIGITS.search(payload):
+        return json.loads(payload, **kwargs)
+    try:
+        return orjson.loads(payload)
+    except orjson.JSONDecodeError:
+        # orjson 不接受标准库可写出的 NaN/Infinity，改用标准库重试
+        return json.loads(payload)
 
 
 def prettify_json(data: Any, indent: int = 2, **kwargs: Any) -> str:
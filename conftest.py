@@ -0,0 +1,4 @@
+"""pytest 根配置
+
+放在仓库根目录，使 pytest 将根目录加入 sys.path，测试直接导入本地 cells 包。
+"""
@@ -1,22 +1,18 @@
 """测试 JSON 序列化器
 
 运行测试：python -m pytest tests/test_serializer.py -v
-或者：python tests/test_serializer.py
+或者：python -m tests.test_serializer
 """
 
 import json
-import sys
+from collections import OrderedDict
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from enum import Enum
 from io import StringIO
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from uuid import uuid4
 
-
-# 添加父目录到路径
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from cells.json import (
     dump,
     dumps,
@@ -24,14 +20,20 @@ from cells.json import (
     load,
     loads,
     safe_json_dumps,
+    safe_json_dumps_bytes,
+    safe_json_roundtrip,
     UniversalSerializer,
     JSONEncodeError,
     CircularReferenceError,
 )
-from cells.json.utils import JsonSerializable, json_serializable, save_json, load_json, prettify_json
+from cells.json.utils import JsonSerializable, json_fragment, json_serializable, save_json, load_json, prettify_json
 from cells.json.adapter import HAS_ORJSON
 
 
+# 固定时间戳，避免测试数据依赖系统时钟
+FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
 class Color(Enum):
     """颜色枚举"""
     RED = 1
@@ -142,6 +144,41 @@ def test_set_and_tuple():
     print("✓ set 和 tuple 测试通过")
 
 
+def test_frozenset_and_pure_path():
+    """测试 frozenset 和 PurePath 序列化"""
+    print("测试 frozenset 和 PurePath...")
+    data = {
+        "frozenset": frozenset({1, 2, 3}),
+        "pure_path": PurePosixPath("/srv/data"),
+    }
+    parsed = json.loads(safe_json_dumps(data))
+    assert sorted(parsed["frozenset"]) == [1, 2, 3]
+    assert parsed["pure_path"] == "/srv/data"
+    parsed = loads(dumps(data, ensure_ascii=False))
+    assert sorted(parsed["frozenset"]) == [1, 2, 3]
+    assert parsed["pure_path"] == "/srv/data"
+    print("✓ frozenset 和 PurePath 测试通过")
+
+
+def test_primitive_subclasses():
+    """测试基础类型子类还原为基础类型"""
+    print("测试基础类型子类...")
+
+    class Price(float):
+        pass
+
+    class Count(int):
+        pass
+
+    class Name(str):
+        pass
+
+    data = {"price": Price(1.5), "items": [Count(2), Name("a")]}
+    assert safe_json_dumps(data) == '{"price":1.5,"items":[2,"a"]}'
+    assert safe_json_roundtrip(data) == {"price": 1.5, "items": [2, "a"]}
+    print("✓ 基础类型子类测试通过")
+
+
 def test_custom_object():
     """测试自定义对象序列化"""
     print("测试自定义对象...")
@@ -165,6 +202,30 @@ def test_custom_object():
     print("✓ 自定义对象测试通过")
 
 
+def test_slots_object():
+    """测试 __slots__ 对象序列化（含继承的槽位）"""
+    print("测试 __slots__ 对象...")
+
+    class Base:
+        __slots__ = ("x", "y")
+
+        def __init__(self, x):
+            self.x = x
+
+    class Child(Base):
+        __slots__ = "z"
+
+        def __init__(self, x, z):
+            super().__init__(x)
+            self.z = z
+
+    result = safe_json_dumps({"base": Base(1), "child": Child(2, 3)})
+    parsed = json.loads(result)
+    assert parsed["base"] == {"x": 1}
+    assert parsed["child"] == {"x": 2, "z": 3}
+    print("✓ __slots__ 对象测试通过")
+
+
 def test_json_serializable_base():
     """测试 JsonSerializable 基类"""
     print("测试 JsonSerializable 基类...")
@@ -200,6 +261,97 @@ def test_json_serializable_decorator():
     print("✓ @json_serializable 装饰器测试通过")
 
 
+def test_json_serializable_decorator_with_slots():
+    """测试 @json_serializable 装饰 __slots__ 类"""
+    print("测试 @json_serializable 装饰 __slots__ 类...")
+
+    @json_serializable
+    class Point:
+        __slots__ = ("x", "y", "label")
+
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+    point = Point(10, 20)
+    assert point.to_dict() == {"x": 10, "y": 20}
+    parsed = json.loads(point.to_json())
+    assert parsed == {"x": 10, "y": 20}
+
+    # 子类新增的槽位与 __dict__ 属性不能被装饰时生成的 to_dict 丢弃
+    class Point3D(Point):
+        __slots__ = ("z",)
+
+        def __init__(self, x, y, z):
+            super().__init__(x, y)
+            self.z = z
+
+    class NotedPoint(Point):
+        def __init__(self, x, y, note):
+            super().__init__(x, y)
+            self.note = note
+
+    assert Point3D(1, 2, 3).to_dict() == {"x": 1, "y": 2, "z": 3}
+    assert NotedPoint(1, 2, "a").to_dict() == {"x": 1, "y": 2, "note": "a"}
+    print("✓ @json_serializable 装饰 __slots__ 类测试通过")
+
+
+def test_json_fragment_decorator():
+    """测试 @json_fragment 装饰器"""
+    print("测试 @json_fragment 装饰器...")
+
+    calls = []
+
+    @json_fragment
+    class Schema(JsonSerializable):
+        def __init__(self, fields):
+            self.fields = fields
+
+        def to_dict(self):
+            calls.append(1)
+            return {"fields": self.fields, "kind": "schema"}
+
+    schema = Schema(["id", "name"])
+    expected = {"schema": {"fields": ["id", "name"], "kind": "schema"}, "count": 2}
+    data = {"schema": schema, "count": 2}
+    assert loads(dumps(data, ensure_ascii=False)) == expected
+    assert loads(dumps(data, ensure_ascii=False)) == expected
+
+    if HAS_ORJSON:
+        import orjson
+
+        if hasattr(orjson, "Fragment"):
+            # 片段缓存后，重复编码不再调用 to_dict()
+            assert isinstance(schema.__json_fragment__(), orjson.Fragment)
+            assert len(calls) == 1
+
+    assert json.loads(safe_json_dumps(data)) == expected
+
+    # 排序与缩进选项不能套用按默认选项编码的片段
+    assert dumps(data, sort_keys=True) == '{"count":2,"schema":{"fields":["id","name"],"kind":"schema"}}'
+    assert dumps(data, indent=2) == json.dumps(expected, indent=2)
+
+    if HAS_ORJSON:
+        import orjson
+
+        # 调用方传入的其他 option 同样不能套用片段
+        @json_fragment
+        class Event(JsonSerializable):
+            def __init__(self, at):
+                self.at = at
+
+        class PlainEvent(JsonSerializable):
+            def __init__(self, at):
+                self.at = at
+
+        at = datetime(2024, 1, 1, 12, 0, 0, 123456)
+        event = Event(at)
+        assert dumps(event) == '{"at":"2024-01-01T12:00:00.123456"}'
+        result = loads(dumps([event, PlainEvent(at)], option=orjson.OPT_OMIT_MICROSECONDS))
+        assert result == [{"at": "2024-01-01T12:00:00"}, {"at": "2024-01-01T12:00:00"}]
+    print("✓ @json_fragment 装饰器测试通过")
+
+
 def test_nested_structures():
     """测试嵌套结构"""
     print("测试嵌套结构...")
@@ -214,7 +366,7 @@ def test_nested_structures():
                 }
             }
         },
-        "timestamp": datetime.now()
+        "timestamp": FIXED_NOW
     }
     result = safe_json_dumps(data)
     parsed = json.loads(result)
@@ -235,6 +387,17 @@ def test_circular_reference():
     assert "CircularReference" in parsed["self"]
     print("✓ 循环引用测试通过（默认模式）")
 
+    # to_dict() 返回的自引用字典
+    class Holder:
+        def __init__(self):
+            self.d = {}
+            self.d["me"] = self.d
+
+        def to_dict(self):
+            return self.d
+
+    assert json.loads(safe_json_dumps(Holder())) == {"me": "<CircularReference dict>"}
+
     # 严格模式：抛出异常
     try:
         safe_json_dumps(a, fail_on_circular=True)
@@ -252,7 +415,7 @@ def test_mixed_types():
             "name": "Alice",
             "age": 25,
             "balance": Decimal("100.50"),
-            "created_at": datetime.now(),
+            "created_at": FIXED_NOW,
             "favorite_color": Color.BLUE,
             "id": uuid4()
         },
@@ -269,6 +432,69 @@ def test_mixed_types():
     print("✓ 混合类型测试通过")
 
 
+def test_safe_json_dumps_stdlib_fallback():
+    """测试 safe_json_dumps 在 orjson 无法处理时回退标准库"""
+    print("测试 safe_json_dumps 标准库回退...")
+    big = 2 ** 70
+    assert json.loads(safe_json_dumps({"big": big})) == {"big": big}
+
+    special = {"nan": float("nan"), "inf": float("inf"), "none": None}
+    assert safe_json_dumps(special) == '{"nan":NaN,"inf":Infinity,"none":null}'
+    assert safe_json_dumps_bytes(special) == b'{"nan":NaN,"inf":Infinity,"none":null}'
+    assert "NaN" in prettify_json(special)
+    assert safe_json_dumps(OrderedDict(nan=float("nan"))) == '{"nan":NaN}'
+    nan = safe_json_roundtrip(OrderedDict(nan=float("nan")))["nan"]
+    assert nan != nan
+
+    # 默认 ensure_ascii=True 时，非 ASCII 输出交给标准库转义
+    assert safe_json_dumps({"name": "中文"}) == '{"name":"\\u4e2d\\u6587"}'
+    assert safe_json_dumps_bytes({"name": "中文"}) == b'{"name":"\\u4e2d\\u6587"}'
+
+    result = safe_json_dumps({"items": [1]}, indent=4)
+    assert "\n        1" in result
+    assert json.loads(result) == {"items": [1]}
+    print("✓ safe_json_dumps 标准库回退测试通过")
+
+
+def test_safe_json_dumps_bytes():
+    """测试 safe_json_dumps_bytes 直接返回字节"""
+    print("测试 safe_json_dumps_bytes...")
+    data = {"name": "中文", "amount": Decimal("10.50"), "date": date(2024, 1, 1)}
+    result = safe_json_dumps_bytes(data, ensure_ascii=False)
+    assert isinstance(result, bytes)
+    assert json.loads(result) == {"name": "中文", "amount": 10.5, "date": "2024-01-01"}
+    assert result.decode("utf-8") == safe_json_dumps(data, ensure_ascii=False)
+
+    class CustomType:
+        pass
+
+    assert safe_json_dumps_bytes(CustomType(), strict=True, ignore_errors=True) == b"null"
+    print("✓ safe_json_dumps_bytes 测试通过")
+
+
+def test_safe_json_roundtrip():
+    """测试 safe_json_roundtrip 编码后再解析"""
+    print("测试 safe_json_roundtrip...")
+    uid = uuid4()
+    data = {"id": uid, "amount": Decimal("10.50"), "tags": ("a", "b"), "color": Color.RED}
+    result = safe_json_roundtrip(data)
+    assert result == {"id": str(uid), "amount": 10.5, "tags": ["a", "b"], "color": 1}
+    assert result == json.loads(safe_json_dumps(data))
+
+    a = {}
+    a["self"] = a
+    assert "CircularReference" in safe_json_roundtrip(a)["self"]
+
+    # 回退标准库编码时用标准库解析，保留超大整数与 NaN
+    big = 2 ** 70
+    result = safe_json_roundtrip({"big": big})
+    assert result == {"big": big} and isinstance(result["big"], int)
+    assert result == json.loads(safe_json_dumps({"big": big}))
+    result = safe_json_roundtrip({"big": big, "nan": float("nan")})
+    assert result["big"] == big and result["nan"] != result["nan"]
+    print("✓ safe_json_roundtrip 测试通过")
+
+
 def test_strict_mode():
     """测试严格模式"""
     print("测试严格模式...")
@@ -320,11 +546,39 @@ def test_numpy_support():
         assert parsed["int64"] == 42
         assert parsed["float64"] == 3.14
         assert parsed["bool_"] is True
+
+        # use_builtin=False 时 numpy 仍走 tolist()/item()，与标准库后端输出一致（float32 不会被缩短）
+        values = {"scalar": np.float32(0.1), "array": np.arange(4, dtype=np.float32).reshape(2, 2).T / 10}
+        assert dumps(values, use_builtin=False) == dumps(values, backend="json")
         print("✓ numpy 支持测试通过")
     except ImportError:
         print("⊘ numpy 未安装，跳过测试")
 
 
+def test_numpy_non_contiguous_array():
+    """测试非连续 numpy 数组在 orjson 主路径下的序列化"""
+    try:
+        import numpy as np
+
+        print("测试非连续 numpy 数组...")
+        array = np.arange(6).reshape(2, 3).T
+        assert not array.flags.c_contiguous
+        parsed = loads(dumps({"array": array}, ensure_ascii=False))
+        assert parsed["array"] == [[0, 3], [1, 4], [2, 5]]
+
+        # 本机字节序的数组转换为连续内存交还 orjson，而不是 tolist()
+        converted = UniversalSerializer().orjson_default(array)
+        assert isinstance(converted, np.ndarray) and converted.flags.c_contiguous
+
+        # 非本机字节序的数组 orjson 无法原生编码，回退 tolist()
+        big_endian = np.arange(6, dtype=">i4").reshape(2, 3).T
+        parsed = loads(dumps({"array": big_endian}, ensure_ascii=False))
+        assert parsed["array"] == [[0, 3], [1, 4], [2, 5]]
+        print("✓ 非连续 numpy 数组测试通过")
+    except ImportError:
+        print("⊘ numpy 未安装，跳过测试")
+
+
 def test_pandas_support():
     """测试 pandas 支持"""
     try:
@@ -366,6 +620,23 @@ def test_file_operations():
         loaded = load_json(filepath)
         assert loaded == data
 
+        # 标准库回退写出的超大整数与 NaN 也能原样读回
+        save_json({"big": 2 ** 70, "nan": float("nan")}, filepath)
+        loaded = load_json(filepath)
+        assert loaded["big"] == 2 ** 70 and isinstance(loaded["big"], int)
+
+        save_json({"small": -(2 ** 63) - 1}, filepath)
+        assert load_json(filepath) == {"small": -(2 ** 63) - 1}
+
+        # 解析失败时仍抛出标准库的 json.JSONDecodeError
+        filepath.write_text("{invalid", encoding="utf-8")
+        try:
+            load_json(filepath)
+            assert False, "应该抛出 json.JSONDecodeError"
+        except json.JSONDecodeError:
+            pass
+        assert loaded["nan"] != loaded["nan"]
+
     print("✓ 文件操作测试通过")
 
 
@@ -480,6 +751,25 @@ def test_orjson_compact_separators_is_adapted():
     print("✓ dumps separators 适配测试通过")
 
 
+def test_stdlib_default_separators_are_compact():
+    """测试标准库路径未指定 separators/indent 时默认输出紧凑格式"""
+    print("测试标准库默认紧凑分隔符...")
+    data = {"a": 1, "b": [1, 2]}
+    assert dumps(data, backend="json") == '{"a":1,"b":[1,2]}'
+
+    serializer = UniversalSerializer()
+    assert serializer.dumps(data) == '{"a":1,"b":[1,2]}'
+    assert serializer.dumps(data, recursive=True) == '{"a":1,"b":[1,2]}'
+    buffer = StringIO()
+    serializer.dump(data, buffer)
+    assert buffer.getvalue() == '{"a":1,"b":[1,2]}'
+
+    # 显式指定 separators 或 indent 时保持标准库行为
+    assert serializer.dumps(data, separators=(", ", ": ")) == '{"a": 1, "b": [1, 2]}'
+    assert serializer.dumps({"a": 1}, indent=2) == '{\n  "a": 1\n}'
+    print("✓ 标准库默认紧凑分隔符测试通过")
+
+
 def test_orjson_check_circular_false_is_accepted():
     """测试 check_circular=False 在 orjson 主路径下可接受"""
     print("测试 dumps check_circular 参数...")
@@ -514,15 +804,24 @@ def run_all_tests():
     test_enum()
     test_path()
     test_set_and_tuple()
+    test_frozenset_and_pure_path()
+    test_primitive_subclasses()
     test_custom_object()
+    test_slots_object()
     test_json_serializable_base()
     test_json_serializable_decorator()
+    test_json_serializable_decorator_with_slots()
+    test_json_fragment_decorator()
     test_nested_structures()
     test_circular_reference()
     test_mixed_types()
+    test_safe_json_dumps_stdlib_fallback()
+    test_safe_json_dumps_bytes()
+    test_safe_json_roundtrip()
     test_strict_mode()
     test_ignore_unknown()
     test_numpy_support()
+    test_numpy_non_contiguous_array()
     test_pandas_support()
     test_file_operations()
     test_prettify()
@@ -534,6 +833,7 @@ def run_all_tests():
     test_orjson_ensure_ascii_is_adapted()
     test_orjson_skipkeys_is_adapted()
     test_orjson_compact_separators_is_adapted()
+    test_stdlib_default_separators_are_compact()
     test_orjson_check_circular_false_is_accepted()
     test_from_cells_import_json_usage()
 